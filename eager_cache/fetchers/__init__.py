@@ -1,5 +1,20 @@
 """Fetchers"""
-from eager_cache.fetchers.abstract_fetcher import AbstractFetcher
+from eager_cache.fetchers.abstract_fetcher import (
+    AbstractFetcher,
+    DataDelta,
+    DataItem,
+    EmptyDataError,
+    FetcherConfigError,
+    FetchError,
+)
 from eager_cache.fetchers.dummy_fetcher import DummyFetcher
 
-__all__ = ["AbstractFetcher", "DummyFetcher"]
+__all__ = [
+    "AbstractFetcher",
+    "DataDelta",
+    "DataItem",
+    "DummyFetcher",
+    "EmptyDataError",
+    "FetcherConfigError",
+    "FetchError",
+]
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import random
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Tuple
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Type
 from urllib.parse import urlencode
 
 from aioredis import Redis
@@ -11,13 +13,31 @@ from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
 from eager_cache.log_utils import fetchers_logger
+from eager_cache.services.executor import (
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    run_in_executor,
+)
 
 # Default values for caching
 # Note: these values can put a lot of stress on the server, since they are low. Change them as you profile your usage.
 DEFAULT_TTL = 10
 DEFAULT_JITTER = 5
+DEFAULT_ERROR_TTL = 5
+# The stats of a key expire after this many refresh periods without reads or fetches
+STATS_TTL_FACTOR = 10
 SEPARATOR = ":"
 SHADOW_KEY_PREFIX = "shadow"
+STATS_KEY_PREFIX = "stats"
+NEGATIVE_KEY_PREFIX = "negative"
+# The shadow value of data served as a fallback after a failed fetch
+STALE_SHADOW_VALUE = "stale"
+# Storage modes of the cached data
+STORAGE_BLOB = "blob"  # The whole data item is serialized to a single value
+STORAGE_HASH = "hash"  # Each top-level field of the data is serialized to a hash field
+META_FIELD = "__meta__"  # The hash field holding the data item without its data
+# The header of the updater's requests, which refresh the data without returning it
+REFRESH_HEADER = "X-Eager-Cache-Refresh"
 
 
 def get_cache_keys(data_type: str, **kwargs: Any) -> Tuple[str, str]:
@@ -38,6 +58,29 @@ def get_cache_keys(data_type: str, **kwargs: Any) -> Tuple[str, str]:
     return cache_key, SHADOW_KEY_PREFIX + SEPARATOR + cache_key
 
 
+def get_stats_key(cache_key: str) -> str:
+    """
+    Gets the stats key for the cache key.
+    The stats key holds a hash of `reads` (since the last fetch), `fetch_cost` (in seconds) and `retrieved_at` (timestamp),
+    which the updater uses to prioritize refreshes.
+
+    :param cache_key: The cache key
+    :return: Stats key
+    """
+    return STATS_KEY_PREFIX + SEPARATOR + cache_key
+
+
+def get_negative_cache_key(cache_key: str) -> str:
+    """
+    Gets the negative cache key for the cache key.
+    The negative cache key holds the result of a failed or empty fetch, so it isn't refetched on every read.
+
+    :param cache_key: The cache key
+    :return: Negative cache key
+    """
+    return NEGATIVE_KEY_PREFIX + SEPARATOR + cache_key
+
+
 def decode_shadow_cache_key(shadow_cache_key: str):
     """
     Given a shadow cache key, calculates the fetch data url.
@@ -58,6 +101,104 @@ def decode_shadow_cache_key(shadow_cache_key: str):
     return f"/{data_type}?{urlencode(query)}"
 
 
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """
+    Applies a [JSON merge patch](https://datatracker.ietf.org/doc/html/rfc7386) to the target.
+    Mappings are merged recursively, `None` values remove keys, and any other value replaces the target.
+
+    :param target: The data to patch.
+    :param patch: The merge patch.
+    :return: The patched data.
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+class FetchError(Exception):
+    """Raised when the data couldn't be fetched, and there is no cached data to fall back to."""
+
+
+class EmptyDataError(Exception):
+    """Raised when the fetcher returned no data."""
+
+
+class FetcherConfigError(Exception):
+    """Raised when a fetcher is misconfigured, or its data doesn't fit its configuration."""
+
+
+def project(data: Any, fields: List[str]) -> Any:
+    """
+    Selects the top-level fields of the data. Missing fields are skipped.
+
+    :param data: The data, should be a mapping.
+    :param fields: The fields to select.
+    :return: The projected data, or the data itself if it isn't a mapping.
+    """
+    if not isinstance(data, dict):
+        return data
+    return {field: data[field] for field in fields if field in data}
+
+
+def run_in_new_event_loop(awaitable: Awaitable[Any]) -> Any:
+    """
+    Runs the awaitable in a new event loop, in an executor worker.
+    The loop is closed explicitly, since a worker runs many fetches.
+
+    :param awaitable: The awaitable to run.
+    :return: The result of the awaitable.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+def fetch_and_dump(
+    fetcher: Type["AbstractFetcher"],
+    cache_key: str,
+    previous_cached_result: Any,
+    kwargs: Dict[str, Any],
+) -> "FetchResult":
+    """
+    Fetches and serializes the data item in an executor worker, off the event loop.
+    This runs the fetch with its post-processing (comparing or merging the data) and serialization in the worker.
+
+    :param fetcher: The fetcher class.
+    :param cache_key: The cache key of the data.
+    :param previous_cached_result: The previous cached result from redis, if any.
+    :param kwargs: Arbitrary keyword arguments of the fetch.
+    :return: The serialized data item, ready for storage, with its metadata.
+    """
+    data_item = run_in_new_event_loop(
+        fetcher.fetch_data_item(cache_key, previous_cached_result, **kwargs),
+    )
+    return fetcher.dump_fetch_result(data_item)
+
+
+def fetch_delta(
+    fetcher: Type["AbstractFetcher"],
+    previous: "DataItem",
+    kwargs: Dict[str, Any],
+) -> "DataDelta":
+    """
+    Fetches the changes since the previous data item in an executor worker, off the event loop.
+
+    :param fetcher: The fetcher class.
+    :param previous: The previous data item.
+    :param kwargs: Arbitrary keyword arguments of the fetch.
+    :return: Data delta.
+    """
+    return run_in_new_event_loop(fetcher._fetch_delta(previous, **kwargs))
+
+
 class DataItem(BaseModel):
     """
     Model representation of data item.
@@ -74,12 +215,51 @@ class DataItem(BaseModel):
     last_modified: datetime  # This is the time when the data itself was last modified.
     # Do not confuse with `last_retrieved`, which is when the data itself was retrieved.
 
+    cursor: Any = None  # The upstream position of the last incremental fetch, if any.
+
+    # Whether this is the last good data, served because its refetch failed.
+    # This is never cached, it is set when reading the data.
+    stale: bool = False
+
+
+class DataDelta(BaseModel):
+    """
+    Model representation of the changes returned by an incremental fetch.
+
+    Comprised of the changes, as a JSON merge patch (empty if nothing has changed),
+    and the upstream cursor to fetch the next changes from.
+    """
+
+    changes: Any
+
+    cursor: Any = None
+
+
+class FetchResult(BaseModel):
+    """
+    Model representation of a fetched data item, serialized for storage.
+
+    Comprised of the serialized data item and the metadata needed to cache it,
+    so the data item itself is loaded only if it is returned.
+    """
+
+    serialized_data_item: Any  # None if the data is empty and empty results are cached
+
+    last_retrieved: datetime
+
+    empty: bool
+
+    # In hash storage, the fields to delete when only the changed fields are set.
+    # None means the serialized data item replaces the whole hash.
+    deleted_fields: Optional[List[str]] = None
+
 
 class AbstractFetcher(ABC):
     """
     Inherit from this class in order to add fetchers.
 
-    Note that you should implement only the _fetch function.
+    Note that you should implement only the _fetch function
+    (and the _fetch_delta function, if the fetcher is incremental).
     """
 
     data_type: str  # this will be used to cache the request
@@ -88,64 +268,680 @@ class AbstractFetcher(ABC):
     )
     jitter: int = DEFAULT_JITTER  # jitter time for cache invalidation, in seconds (default is 5 seconds)
     serializer = json  # override this with your preferred serializer. should support loads and dumps.
+    # set this if you implement _fetch_delta, to refetch only the changes.
+    incremental: bool = False
+    storage: str = STORAGE_BLOB  # set this to STORAGE_HASH for mappings, to read only the requested fields.
+    # time to cache failed fetches, in seconds (None disables it)
+    error_ttl: Optional[int] = DEFAULT_ERROR_TTL
+    # time to cache empty results as not found, in seconds (None disables it)
+    empty_ttl: Optional[int] = None
+    # set this to EXECUTOR_THREAD or EXECUTOR_PROCESS to fetch off the event loop.
+    executor: Optional[str] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Validates the configuration of the fetcher when it is defined,
+        so configuration mistakes fail loudly instead of being cached as failed fetches.
+
+        :param **kwargs: Arbitrary keyword arguments.
+        :raises FetcherConfigError: If the fetcher is misconfigured.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.storage not in {STORAGE_BLOB, STORAGE_HASH}:
+            raise FetcherConfigError(f"Unknown storage {cls.storage} of {cls.__name__}")
+        if cls.executor not in {None, EXECUTOR_THREAD, EXECUTOR_PROCESS}:
+            raise FetcherConfigError(
+                f"Unknown executor {cls.executor} of {cls.__name__}",
+            )
+        if cls.executor == EXECUTOR_PROCESS and "<locals>" in cls.__qualname__:
+            # Process pool workers import the fetcher by its name, which local classes don't have
+            raise FetcherConfigError(
+                f"Process executor of {cls.__name__} requires a module-level class",
+            )
 
     @classmethod
-    async def fetch(cls, redis: Redis, **kwargs: Any) -> DataItem:
+    async def fetch(
+        cls,
+        redis: Redis,
+        fields: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> DataItem:
         """
         Wraps the internal _fetch logic with eager caching.
         We use a [shadow key](https://stackoverflow.com/a/28647773/938227) for each record, which indicates whether the cached data is valid.
         If the shadow key doesn't exist, we fetch the data and return it.
         If the shadow key exists, we just return the cached data.
+        Failed and empty fetches are cached for a short time, and a failed fetch falls back to the last good data.
 
+        :param fields: Top-level fields of the data to return, all of them if None.
         :param **kwargs: Arbitrary keyword arguments.
+        :raises EmptyDataError: If the fetcher returned no data.
+        :raises FetchError: If the fetch failed and there is no data to fall back to.
+        :raises NotImplementedError: If the fetcher doesn't implement the fetch it is configured for.
+        :raises FetcherConfigError: If the fetcher is misconfigured.
         :return: Data item.
         """
+        return await cls.fetch_or_refresh(redis, fields, True, kwargs)
+
+    @classmethod
+    async def refresh(cls, redis: Redis, **kwargs: Any) -> None:
+        """
+        Refetches the data if its shadow key doesn't exist, like `fetch`, without loading the data item.
+        This is used by the updater, which doesn't need the data.
+
+        :param **kwargs: Arbitrary keyword arguments.
+        :raises EmptyDataError: If the fetcher returned no data.
+        :raises FetchError: If the fetch failed and there is no data to fall back to.
+        :raises NotImplementedError: If the fetcher doesn't implement the fetch it is configured for.
+        :raises FetcherConfigError: If the fetcher is misconfigured.
+        """
+        await cls.fetch_or_refresh(redis, None, False, kwargs)
+
+    @classmethod
+    async def fetch_or_refresh(
+        cls,
+        redis: Redis,
+        fields: Optional[List[str]],
+        load: bool,
+        kwargs: Dict[str, Any],
+    ) -> Optional[DataItem]:
+        """
+        Implements `fetch` and `refresh`.
+
+        :param redis: The redis object used to manage cache.
+        :param fields: Top-level fields of the data to return, all of them if None.
+        :param load: Whether to load and return the data item.
+        :param kwargs: Arbitrary keyword arguments of the fetch.
+        :return: Data item, or None if it isn't loaded.
+        """
         cache_key, shadow_cache_key = get_cache_keys(cls.data_type, **kwargs)
         fetchers_logger.info(
             f"Got key: {cache_key}, shadow: {shadow_cache_key}",
             extra={"cahce_key": cache_key, "shadow_cache_key": shadow_cache_key},
         )
-        shadow = await redis.get(name=shadow_cache_key)
+        stats_key = get_stats_key(cache_key)
+        negative_cache_key = get_negative_cache_key(cache_key)
+        async with redis.pipeline(transaction=False) as pipe:
+            shadow, _, _, negative_result = await (
+                pipe.get(shadow_cache_key)
+                .hincrby(stats_key, "reads", 1)
+                .expire(stats_key, cls.stats_ttl())
+                .get(negative_cache_key)
+                .execute()
+            )
         if shadow is None:
+            if negative_result is not None:
+                # The last fetch failed or was empty, don't refetch until the negative result expires
+                cls.raise_negative_result(cache_key, negative_result)
+
             # If we don't have a shadow key, it means that the data has either expired or never been fetched.
             # Either way, we need to refetch the data.
-            fetched_data = await cls._fetch(**kwargs)
-            fetchers_logger.info(
-                "Fetched new data",
-                extra={"cahce_key": cache_key, "fetched_data": fetched_data},
+            previous_cached_result = await cls.get_cached_result(redis, cache_key)
+            fetch_started = time.perf_counter()
+            data_item = None
+            try:
+                if (
+                    cls.incremental
+                    and cls.storage == STORAGE_HASH
+                    and previous_cached_result is not None
+                ):
+                    fetch_result = await cls.fetch_incremental_hash(
+                        redis,
+                        cache_key,
+                        previous_cached_result,
+                        **kwargs,
+                    )
+                elif cls.executor is None:
+                    data_item = await cls.fetch_data_item(
+                        cache_key,
+                        previous_cached_result,
+                        **kwargs,
+                    )
+                    fetch_result = cls.dump_fetch_result(data_item)
+                else:
+                    # The worker returns the data item serialized for storage, so it is loaded only if it is returned
+                    fetch_result = await run_in_executor(
+                        cls.executor,
+                        fetch_and_dump,
+                        cls,
+                        cache_key,
+                        previous_cached_result,
+                        kwargs,
+                    )
+            except (NotImplementedError, FetcherConfigError):
+                # These are bugs in the fetcher (e.g. an incremental fetcher without _fetch_delta), so fail loudly
+                raise
+            except Exception as ex:
+                fetchers_logger.exception(
+                    "Failed fetching data",
+                    extra={"cahce_key": cache_key},
+                )
+                if cls.error_ttl is None:
+                    raise
+                data_item = await cls.fallback_on_error(
+                    redis,
+                    cache_key,
+                    shadow_cache_key,
+                    previous_cached_result,
+                    ex,
+                )
+            else:
+                fetch_cost = time.perf_counter() - fetch_started
+                if cls.empty_ttl is not None and fetch_result.empty:
+                    await cls.set_empty_result(redis, cache_key)
+                    raise EmptyDataError(f"No data for {cache_key}")
+
+                # Finally, set the data and the shadow in the cache
+                await cls.set_cache_data_and_shadow(
+                    redis,
+                    cache_key,
+                    shadow_cache_key,
+                    data_item,
+                    fetch_result.serialized_data_item,
+                    fetch_result.deleted_fields,
+                )
+                async with redis.pipeline(transaction=False) as pipe:
+                    await (
+                        pipe.hset(
+                            stats_key,
+                            mapping={
+                                "reads": 0,
+                                "fetch_cost": fetch_cost,
+                                "retrieved_at": fetch_result.last_retrieved.timestamp(),
+                            },
+                        )
+                        .expire(stats_key, cls.stats_ttl())
+                        .execute()
+                    )
+                fetchers_logger.info(
+                    "Cached data",
+                    extra={"cahce_key": cache_key},
+                )
+                if data_item is None and load:
+                    if fetch_result.deleted_fields is not None:
+                        # Only the changed fields were fetched, so the data item is read from the cache
+                        return await cls.get_cached_data_item(redis, cache_key, fields)
+                    return cls.load_data_item(fetch_result.serialized_data_item, fields)
+
+            if data_item is None or not load:
+                return None
+            if fields is not None:
+                return data_item.copy(update={"data": project(data_item.data, fields)})
+            return data_item
+
+        if not load:
+            return None
+        data_item = await cls.get_cached_data_item(redis, cache_key, fields)
+        if shadow in {STALE_SHADOW_VALUE, STALE_SHADOW_VALUE.encode()}:
+            data_item.stale = True
+        return data_item
+
+    @classmethod
+    async def fallback_on_error(
+        cls,
+        redis: Redis,
+        cache_key: str,
+        shadow_cache_key: str,
+        previous_cached_result: Any,
+        error: Exception,
+    ) -> DataItem:
+        """
+        Falls back to the last good data after a failed fetch, and retries only after `error_ttl`.
+        If there is no data to fall back to, caches the error instead.
+
+        :param redis: The redis object used to manage cache.
+        :param cache_key: The cache key of the data.
+        :param shadow_cache_key: The shadow cache key of the data.
+        :param previous_cached_result: The previous cached result from redis, if any.
+        :param error: The fetch error.
+        :raises FetchError: If there is no data to fall back to.
+        :return: The last good data item, marked as stale.
+        """
+        if previous_cached_result is None:
+            await redis.set(
+                get_negative_cache_key(cache_key),
+                # Cache only the error type, since its message may expose upstream details (e.g. urls and tokens)
+                cls.serializer.dumps({"empty": False, "error": type(error).__name__}),
+                ex=cls.error_ttl,
             )
+            raise FetchError(
+                f"Failed fetching {cache_key}: {type(error).__name__}",
+            ) from error
+
+        # Mark the data as stale until its refetch, which the updater will issue after error_ttl
+        await redis.set(shadow_cache_key, STALE_SHADOW_VALUE, ex=cls.error_ttl)
+        if cls.incremental and cls.storage == STORAGE_HASH:
+            # The previous cached result holds only the metadata
+            data_item = await cls.get_cached_data_item(redis, cache_key)
+        else:
+            data_item = DataItem(**cls.serializer.loads(previous_cached_result))
+        data_item.stale = True
+        return data_item
+
+    @classmethod
+    async def set_empty_result(cls, redis: Redis, cache_key: str) -> None:
+        """
+        Caches an empty result for `empty_ttl`, dropping the outdated data and its stats.
+
+        :param redis: The redis object used to manage cache.
+        :param cache_key: The cache key of the data.
+        """
+        async with redis.pipeline(transaction=True) as pipe:
+            await (
+                pipe.set(
+                    get_negative_cache_key(cache_key),
+                    cls.serializer.dumps({"empty": True, "error": None}),
+                    ex=cls.empty_ttl,
+                )
+                .delete(cache_key, get_stats_key(cache_key))
+                .execute()
+            )
+
+    @classmethod
+    def raise_negative_result(cls, cache_key: str, negative_result: Any) -> None:
+        """
+        Raises the cached negative result.
 
-            # Check if the data has been modified since last retrieved
-            previous_cached_result = await redis.get(name=cache_key)
+        :param cache_key: The cache key of the data.
+        :param negative_result: The negative result from redis.
+        :raises EmptyDataError: If the fetcher returned no data.
+        :raises FetchError: If the fetch failed.
+        """
+        negative_result = cls.serializer.loads(negative_result)
+        if negative_result["empty"]:
+            raise EmptyDataError(f"No data for {cache_key}")
+        raise FetchError(f"Failed fetching {cache_key}: {negative_result['error']}")
+
+    @classmethod
+    def stats_ttl(cls) -> int:
+        """
+        Gets the time to keep the stats of a key, so keys that are no longer requested don't leave them behind.
+
+        :return: Stats ttl, in seconds.
+        """
+        return (cls.ttl + cls.jitter) * STATS_TTL_FACTOR
 
-            # Calculate the last_modified time
-            last_modified = cls.calculate_last_modified(
+    @classmethod
+    def is_empty(cls, data: Any) -> bool:
+        """
+        Checks whether the fetched data is empty. Override this if your data has another notion of emptiness.
+
+        :param data: The fetched data.
+        :return: Whether the data is empty.
+        """
+        return data is None or data == {} or data == [] or data == ""
+
+    @classmethod
+    async def get_cached_data_item(
+        cls,
+        redis: Redis,
+        cache_key: str,
+        fields: Optional[List[str]] = None,
+    ) -> DataItem:
+        """
+        Reads the cached data item.
+        In hash storage, only the requested fields are read from redis.
+
+        :param redis: The redis object used to manage cache.
+        :param cache_key: The cache key of the data.
+        :param fields: Top-level fields of the data to return, all of them if None.
+        :return: Data item.
+        """
+        if cls.storage == STORAGE_HASH:
+            if fields is None:
+                cached_data_item = await redis.hgetall(cache_key)
+            else:
+                values = await redis.hmget(cache_key, META_FIELD, *fields)
+                cached_data_item = dict(zip([META_FIELD, *fields], values))
+        else:
+            cached_data_item = await redis.get(name=cache_key)
+        return cls.load_data_item(cached_data_item, fields)
+
+    @classmethod
+    async def get_cached_result(cls, redis: Redis, cache_key: str) -> Any:
+        """
+        Reads the cached data item, serialized as a whole regardless of its storage.
+        Incremental fetchers in hash storage read and update only the fields their changes touch,
+        so only the metadata is read, with empty data.
+
+        :param redis: The redis object used to manage cache.
+        :param cache_key: The cache key of the data.
+        :return: The serialized data item, or None if it isn't cached.
+        """
+        if cls.storage == STORAGE_HASH:
+            if cls.incremental:
+                meta = await redis.hget(cache_key, META_FIELD)
+                if meta is None:
+                    return None
+                return cls.serializer.dumps({**cls.serializer.loads(meta), "data": {}})
+            cached_hash = await redis.hgetall(cache_key)
+            if not cached_hash:
+                return None
+            return cls.serializer.dumps(cls.loads_hash(cached_hash))
+        return await redis.get(name=cache_key)
+
+    @classmethod
+    def dumps(cls, data_item: DataItem) -> Any:
+        """
+        Serializes the data item for storage.
+
+        :param data_item: The data item.
+        :return: The serialized data item, or its hash fields in hash storage.
+        """
+        if cls.storage == STORAGE_HASH:
+            return cls.dumps_hash(data_item)
+        return cls.serializer.dumps(jsonable_encoder(data_item, exclude={"stale"}))
+
+    @classmethod
+    def loads(cls, serialized_data_item: Any) -> Dict[str, Any]:
+        """
+        Deserializes a data item from storage.
+
+        :param serialized_data_item: The serialized data item, or its hash fields in hash storage.
+        :return: Data item mapping.
+        """
+        if cls.storage == STORAGE_HASH:
+            return cls.loads_hash(serialized_data_item)
+        return cls.serializer.loads(serialized_data_item)
+
+    @classmethod
+    def load_data_item(
+        cls,
+        serialized_data_item: Any,
+        fields: Optional[List[str]] = None,
+    ) -> DataItem:
+        """
+        Loads a serialized data item.
+        In hash storage, only the requested fields are deserialized.
+
+        :param serialized_data_item: The serialized data item, or its hash fields in hash storage.
+        :param fields: Top-level fields of the data to return, all of them if None.
+        :return: Data item.
+        """
+        if cls.storage == STORAGE_HASH:
+            if fields is not None:
+                selected = {META_FIELD, *fields}
+                serialized_data_item = {
+                    key: value
+                    for key, value in serialized_data_item.items()
+                    if (key.decode() if isinstance(key, bytes) else key) in selected
+                }
+            return DataItem(**cls.loads_hash(serialized_data_item))
+
+        data_item = DataItem(**cls.serializer.loads(serialized_data_item))
+        if fields is not None:
+            data_item.data = project(data_item.data, fields)
+        return data_item
+
+    @classmethod
+    def dump_fetch_result(cls, data_item: DataItem) -> FetchResult:
+        """
+        Serializes a fetched data item for storage, with the metadata needed to cache it.
+        Empty data isn't serialized if empty results are cached, since it isn't stored.
+
+        :param data_item: The fetched data item.
+        :return: Fetch result.
+        """
+        empty = cls.is_empty(data_item.data)
+        return FetchResult(
+            serialized_data_item=(
+                None if empty and cls.empty_ttl is not None else cls.dumps(data_item)
+            ),
+            last_retrieved=data_item.last_retrieved,
+            empty=empty,
+        )
+
+    @classmethod
+    def dumps_hash(cls, data_item: DataItem) -> Dict[str, Any]:
+        """
+        Serializes the data item to hash fields: the metadata and each top-level field of the data.
+
+        :param data_item: The data item.
+        :raises FetcherConfigError: If the data isn't a mapping, or it has a field named like the metadata field.
+        :return: Hash fields.
+        """
+        if not isinstance(data_item.data, dict):
+            raise FetcherConfigError(
+                f"Hash storage of {cls.data_type} requires mapping data, got {type(data_item.data).__name__}",
+            )
+        if META_FIELD in data_item.data:
+            raise FetcherConfigError(
+                f"Hash storage of {cls.data_type} reserves the {META_FIELD} field for the metadata",
+            )
+        cached_hash = {
+            key: cls.serializer.dumps(jsonable_encoder(value))
+            for key, value in data_item.data.items()
+        }
+        cached_hash[META_FIELD] = cls.serializer.dumps(
+            jsonable_encoder(data_item, exclude={"data", "stale"}),
+        )
+        return cached_hash
+
+    @classmethod
+    def loads_hash(cls, cached_hash: Dict[Any, Any]) -> Dict[str, Any]:
+        """
+        Deserializes hash fields to a data item mapping. Missing fields are skipped.
+
+        :param cached_hash: Hash fields, as read from redis.
+        :return: Data item mapping.
+        """
+        data = {}
+        meta = {}
+        for key, value in cached_hash.items():
+            if value is None:
+                continue
+            key = key.decode() if isinstance(key, bytes) else key
+            if key == META_FIELD:
+                meta = cls.serializer.loads(value)
+            else:
+                data[key] = cls.serializer.loads(value)
+        return {**meta, "data": data}
+
+    @classmethod
+    async def fetch_data_item(
+        cls,
+        cache_key: str,
+        previous_cached_result: Any,
+        **kwargs: Any,
+    ) -> DataItem:
+        """
+        Fetches the data item, incrementally if the fetcher supports it and there is a previous cached result.
+
+        :param cache_key: The cache key of the data.
+        :param previous_cached_result: The previous cached result from redis, if any.
+        :param **kwargs: Arbitrary keyword arguments.
+        :return: Data item.
+        """
+        if cls.incremental and previous_cached_result is not None:
+            return await cls.fetch_incremental(
                 cache_key,
-                fetched_data,
                 previous_cached_result,
+                **kwargs,
+            )
+        return await cls.fetch_full(cache_key, previous_cached_result, **kwargs)
+
+    @classmethod
+    async def fetch_full(
+        cls,
+        cache_key: str,
+        previous_cached_result: Any,
+        **kwargs: Any,
+    ) -> DataItem:
+        """
+        Fetches the whole data, and compares it to the previous cached result.
+
+        :param cache_key: The cache key of the data.
+        :param previous_cached_result: The previous cached result from redis, if any.
+        :param **kwargs: Arbitrary keyword arguments.
+        :return: Data item.
+        """
+        fetched_data = await cls._fetch(**kwargs)
+        fetchers_logger.info(
+            "Fetched new data",
+            extra={"cahce_key": cache_key, "fetched_data": fetched_data},
+        )
+
+        # Calculate the last_modified time
+        last_modified = cls.calculate_last_modified(
+            cache_key,
+            fetched_data,
+            previous_cached_result,
+        )
+
+        return DataItem(
+            last_modified=last_modified,
+            last_retrieved=datetime.now(),
+            data=fetched_data,
+        )
+
+    @classmethod
+    async def fetch_incremental(
+        cls,
+        cache_key: str,
+        previous_cached_result: Any,
+        **kwargs: Any,
+    ) -> DataItem:
+        """
+        Fetches only the changes since the previous cached result, and merges them into its data.
+        Since the delta holds only the changes, there is no need to compare the whole data.
+
+        :param cache_key: The cache key of the data.
+        :param previous_cached_result: The previous cached result from redis.
+        :param **kwargs: Arbitrary keyword arguments.
+        :return: Data item.
+        """
+        previous_data_item = DataItem(**cls.serializer.loads(previous_cached_result))
+        delta = await cls._fetch_delta(previous_data_item, **kwargs)
+        fetchers_logger.info(
+            "Fetched data delta",
+            extra={"cahce_key": cache_key, "changes": delta.changes},
+        )
+
+        data = previous_data_item.data
+        last_modified = previous_data_item.last_modified
+        # Only an empty merge patch means no changes, any other value replaces the data
+        if delta.changes != {}:
+            fetchers_logger.info(
+                "Data has been modified since last fetch",
+                extra={
+                    "cahce_key": cache_key,
+                },
+            )
+            data = cls.merge_delta(data, delta.changes)
+            last_modified = datetime.now()
+
+        return DataItem(
+            last_modified=last_modified,
+            last_retrieved=datetime.now(),
+            data=data,
+            cursor=delta.cursor,
+        )
+
+    @classmethod
+    async def fetch_incremental_hash(
+        cls,
+        redis: Redis,
+        cache_key: str,
+        previous_cached_result: Any,
+        **kwargs: Any,
+    ) -> FetchResult:
+        """
+        Fetches only the changes since the previous cached result, in hash storage.
+        Only the hash fields the changes touch are read, merged and updated,
+        and the fields the changes remove are deleted.
+        Since the previous cached result holds only the metadata, `_fetch_delta` gets a data item with empty data.
+
+        :param redis: The redis object used to manage cache.
+        :param cache_key: The cache key of the data.
+        :param previous_cached_result: The previous cached result from redis, holding only the metadata.
+        :param **kwargs: Arbitrary keyword arguments.
+        :return: Fetch result, with the changed fields and the fields to delete.
+        """
+        previous_data_item = DataItem(**cls.serializer.loads(previous_cached_result))
+        if cls.executor is None:
+            delta = await cls._fetch_delta(previous_data_item, **kwargs)
+        else:
+            delta = await run_in_executor(
+                cls.executor,
+                fetch_delta,
+                cls,
+                previous_data_item,
+                kwargs,
             )
+        fetchers_logger.info(
+            "Fetched data delta",
+            extra={"cahce_key": cache_key, "changes": delta.changes},
+        )
 
-            data_item = DataItem(
-                last_modified=last_modified,
-                last_retrieved=datetime.now(),
-                data=fetched_data,
+        if not isinstance(delta.changes, dict):
+            # Any value other than a mapping replaces the data
+            return cls.dump_fetch_result(
+                DataItem(
+                    last_modified=datetime.now(),
+                    last_retrieved=datetime.now(),
+                    data=delta.changes,
+                    cursor=delta.cursor,
+                ),
             )
 
-            # Finally, set the data and the shadow in the cache
-            await cls.set_cache_data_and_shadow(
-                redis,
-                cache_key,
-                shadow_cache_key,
-                data_item,
+        touched_fields = list(delta.changes)
+        async with redis.pipeline(transaction=False) as pipe:
+            hash_length, previous_values = await (
+                pipe.hlen(cache_key)
+                .hmget(cache_key, META_FIELD, *touched_fields)
+                .execute()
             )
+        previous_data = cls.loads_hash(
+            dict(zip(touched_fields, previous_values[1:])),
+        )["data"]
+
+        data = {}
+        last_modified = previous_data_item.last_modified
+        # Only an empty merge patch means no changes
+        if delta.changes != {}:
             fetchers_logger.info(
-                "Cached data",
-                extra={"cahce_key": cache_key, "data": fetched_data},
+                "Data has been modified since last fetch",
+                extra={
+                    "cahce_key": cache_key,
+                },
             )
+            data = cls.merge_delta(previous_data, delta.changes)
+            last_modified = datetime.now()
+        deleted_fields = [field for field in touched_fields if field not in data]
+
+        # The hash holds the metadata field and the data fields
+        fields_count = (
+            hash_length
+            - 1
+            - len([field for field in previous_data if field not in data])
+            + len([field for field in data if field not in previous_data])
+        )
+        return FetchResult(
+            serialized_data_item=cls.dumps_hash(
+                DataItem(
+                    last_modified=last_modified,
+                    last_retrieved=datetime.now(),
+                    data=data,
+                    cursor=delta.cursor,
+                ),
+            ),
+            last_retrieved=datetime.now(),
+            empty=fields_count == 0,
+            deleted_fields=deleted_fields,
+        )
 
-            return data_item
+    @classmethod
+    def merge_delta(cls, data: Any, changes: Any) -> Any:
+        """
+        Merges the changes of a delta into the data.
+        Override this if your upstream returns changes in another format.
+        In hash storage, the changes are a mapping, and the data holds only the fields they touch.
 
-        return DataItem(**cls.serializer.loads(await redis.get(name=cache_key)))
+        :param data: The previous data.
+        :param changes: The changes, as a JSON merge patch.
+        :return: The merged data.
+        """
+        return apply_merge_patch(data, changes)
 
     @classmethod
     async def set_cache_data_and_shadow(
@@ -154,11 +950,22 @@ class AbstractFetcher(ABC):
         cache_key,
         shadow_cache_key,
         data_item,
+        serialized_data_item=None,
+        deleted_fields=None,
     ):
-        await redis.set(
-            cache_key,
-            cls.serializer.dumps(jsonable_encoder(data_item)),
-        )
+        if serialized_data_item is None:
+            serialized_data_item = cls.dumps(data_item)
+        if cls.storage == STORAGE_HASH:
+            # Update the hash atomically, so readers don't see it partially written
+            async with redis.pipeline(transaction=True) as pipe:
+                if deleted_fields is None:
+                    # Replace the hash, so removed fields don't linger
+                    pipe.delete(cache_key)
+                elif deleted_fields:
+                    pipe.hdel(cache_key, *deleted_fields)
+                await pipe.hset(cache_key, mapping=serialized_data_item).execute()
+        else:
+            await redis.set(cache_key, serialized_data_item)
         await redis.set(
             name=shadow_cache_key,
             value="",
@@ -206,3 +1013,9 @@ class AbstractFetcher(ABC):
     async def _fetch(cls, **kwargs: Any) -> Any:
         # The internal fetch method you need to override.
         raise NotImplementedError
+
+    @classmethod
+    async def _fetch_delta(cls, previous: DataItem, **kwargs: Any) -> DataDelta:
+        # The internal incremental fetch method you need to override if `incremental` is set.
+        # Fetch the changes since `previous.last_retrieved` (or `previous.cursor`).
+        raise NotImplementedError
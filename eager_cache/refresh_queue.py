@@ -0,0 +1,148 @@
+import itertools
+from dataclasses import dataclass
+from threading import Condition
+from time import time
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+# Baseline fetch cost, in seconds, for keys that were never timed.
+# This keeps unknown keys from being starved by keys with a measured cost.
+DEFAULT_FETCH_COST = 0.1
+# Number of seconds of staleness that doubles the priority of a key.
+STALENESS_SCALE = 60
+
+
+@dataclass
+class RefreshTask:
+    """
+    A pending refresh of a shadow cache key.
+
+    The priority of a task is not fixed: it grows with the staleness of the key,
+    including the time the task waits in the queue.
+    """
+
+    shadow_cache_key: str
+    weight: float  # (reads + 1) * fetch_cost, the latency a refresh saves
+    retrieved_at: float  # When the data was last retrieved, as a timestamp
+    sequence: int  # Arrival order, for breaking ties
+
+    @classmethod
+    def from_stats(
+        cls,
+        shadow_cache_key: str,
+        stats: Mapping[str, Union[str, bytes]],
+        sequence: int = 0,
+        now: Optional[float] = None,
+    ) -> "RefreshTask":
+        """
+        Creates a refresh task from the stats the fetcher recorded.
+
+        :param shadow_cache_key: The shadow cache key to refresh.
+        :param stats: The stats hash of the key (`reads`, `fetch_cost` and `retrieved_at`).
+        :param sequence: Arrival order of the task.
+        :param now: The current timestamp, used for keys that were never retrieved. Defaults to `time()`.
+        :return: Refresh task.
+        """
+        if now is None:
+            now = time()
+        reads = int(stats.get("reads", 0))
+        fetch_cost = float(stats.get("fetch_cost", DEFAULT_FETCH_COST))
+        return cls(
+            shadow_cache_key=shadow_cache_key,
+            weight=(reads + 1) * fetch_cost,
+            retrieved_at=float(stats.get("retrieved_at", now)),
+            sequence=sequence,
+        )
+
+    def priority(self, now: Optional[float] = None) -> float:
+        """
+        Calculates the priority of the refresh at the given time.
+
+        The priority estimates how much user-facing latency a refresh saves:
+        every read of a stale key pays the fetch cost synchronously,
+        so hot and expensive keys come first, and the longer a key is stale the more urgent it becomes.
+
+        :param now: The current timestamp, defaults to `time()`.
+        :return: The refresh priority, higher is more urgent.
+        """
+        if now is None:
+            now = time()
+        staleness = max(now - self.retrieved_at, 0)
+        return self.weight * (1 + staleness / STALENESS_SCALE)
+
+
+class RefreshQueue:
+    """
+    A thread safe priority queue of refreshes.
+
+    Each shadow key is queued at most once; queueing it again keeps the higher priority.
+    When the queue is full, the lowest priority refresh is shed,
+    and the key will be refreshed lazily on its next read.
+
+    Priorities grow at different rates as keys go stale, so their order changes over time.
+    Therefore, priorities are compared when popping or shedding a task, by scanning the (bounded) queue.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._tasks: Dict[str, RefreshTask] = {}
+        self._counter = itertools.count()
+        self._condition = Condition()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def put(
+        self,
+        shadow_cache_key: str,
+        stats: Mapping[str, Union[str, bytes]],
+    ) -> Optional[RefreshTask]:
+        """
+        Queues a refresh of the shadow key.
+
+        :param shadow_cache_key: The shadow cache key to refresh.
+        :param stats: The stats hash of the key, used to calculate its priority.
+        :return: The shed task if the queue overflowed, otherwise None.
+        """
+        now = time()
+        with self._condition:
+            task = RefreshTask.from_stats(
+                shadow_cache_key,
+                stats,
+                sequence=next(self._counter),
+                now=now,
+            )
+            queued = self._tasks.get(shadow_cache_key)
+            if queued is not None:
+                if queued.priority(now) >= task.priority(now):
+                    return None
+                task.sequence = queued.sequence
+            self._tasks[shadow_cache_key] = task
+            shed = None
+            if len(self._tasks) > self.max_size:
+                shed = min(
+                    self._tasks.values(),
+                    key=lambda queued: self._rank(queued, now),
+                )
+                del self._tasks[shed.shadow_cache_key]
+            self._condition.notify()
+            return shed
+
+    def get(self, timeout: Optional[float] = None) -> Optional[RefreshTask]:
+        """
+        Pops the highest priority refresh, waiting for one if the queue is empty.
+
+        :param timeout: Maximum number of seconds to wait, waits forever if None.
+        :return: The refresh task, or None if the timeout has passed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._tasks, timeout=timeout):
+                return None
+            now = time()
+            task = max(self._tasks.values(), key=lambda queued: self._rank(queued, now))
+            del self._tasks[task.shadow_cache_key]
+            return task
+
+    @staticmethod
+    def _rank(task: RefreshTask, now: float) -> Tuple[float, int]:
+        # Higher priority first, then earlier arrival
+        return task.priority(now), -task.sequence
@@ -0,0 +1,68 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict
+
+from eager_cache.settings import settings
+
+# Execution modes of fetchers
+EXECUTOR_THREAD = "thread"  # Run in a thread pool, for blocking fetchers
+EXECUTOR_PROCESS = "process"  # Run in a process pool, for CPU bound fetchers
+
+_executors: Dict[str, Executor] = {}
+
+
+def get_executor(executor: str) -> Executor:
+    """
+    Gets the shared pool of the execution mode, creating it on first use.
+
+    :param executor: The execution mode.
+    :raises ValueError: If the execution mode is unknown.
+    :return: The pool.
+    """
+    if executor not in _executors:
+        if executor == EXECUTOR_THREAD:
+            _executors[executor] = ThreadPoolExecutor(
+                max_workers=settings.fetch_thread_workers_count,
+                thread_name_prefix="fetch",
+            )
+        elif executor == EXECUTOR_PROCESS:
+            # Spawn workers, since forking a process with a running event loop and threads is unsafe
+            _executors[executor] = ProcessPoolExecutor(
+                max_workers=settings.fetch_process_workers_count,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            raise ValueError(f"Unknown executor {executor}")
+    return _executors[executor]
+
+
+async def run_in_executor(executor: str, func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs the function in the shared pool of the execution mode, without blocking the event loop.
+    In a process pool, the function and its arguments must be picklable.
+    If a worker process dies, which breaks the whole pool, the pool is replaced and the function is retried once.
+
+    :param executor: The execution mode.
+    :param func: The function to run.
+    :param args: Arguments of the function.
+    :return: The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_executor(executor)
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # Concurrent callers may have replaced the broken pool already
+        if _executors.get(executor) is pool:
+            del _executors[executor]
+            pool.shutdown(wait=False, cancel_futures=True)
+        return await loop.run_in_executor(get_executor(executor), func, *args)
+
+
+def shutdown_executors() -> None:
+    """Shuts down the pools without blocking, cancelling pending functions."""
+    for executor in _executors.values():
+        executor.shutdown(wait=False, cancel_futures=True)
+    _executors.clear()
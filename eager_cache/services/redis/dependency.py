@@ -8,14 +8,10 @@ async def get_redis_connection(request: Request) -> AsyncGenerator[Redis, None]:
     """
     Get redis client.
 
-    This dependency acquires connection from pool.
+    This dependency returns the client shared by all requests,
+    which acquires connections from the pool per command.
 
     :param request: current request.
     :yield: redis client.
     """
-    redis_client = Redis(connection_pool=request.app.state.redis_pool)
-
-    try:  # noqa: WPS501
-        yield redis_client
-    finally:
-        await redis_client.close()
+    yield request.app.state.redis
@@ -0,0 +1,159 @@
+import time
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import aioredis
+import aioredis.connection
+import redis
+import redis.connection
+
+from eager_cache.settings import settings
+
+
+class PoolStats:
+    """
+    Connection pool usage, reported by the monitoring API and logged by the updater.
+
+    Keeps track of the time spent waiting for a free connection,
+    which grows as the pool gets saturated.
+    """
+
+    def __init__(self) -> None:
+        self.acquisitions = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self._lock = Lock()
+
+    def record_acquisition(self, wait_time: float) -> None:
+        """
+        Records the time it took to acquire a connection.
+
+        :param wait_time: Wait time, in seconds.
+        """
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def report(self, in_use: int, max_connections: int) -> Dict[str, Any]:
+        """
+        Reports the pool usage.
+
+        :param in_use: Number of connections currently acquired.
+        :param max_connections: Size of the pool.
+        :return: Pool usage report.
+        """
+        with self._lock:
+            average_wait_time = (
+                self.total_wait_time / self.acquisitions if self.acquisitions else 0
+            )
+            return {
+                "in_use": in_use,
+                "max_connections": max_connections,
+                "saturation": in_use / max_connections,
+                "acquisitions": self.acquisitions,
+                "average_wait_time": average_wait_time,
+                "max_wait_time": self.max_wait_time,
+            }
+
+
+class InstrumentedConnectionPool(aioredis.BlockingConnectionPool):
+    """An async blocking connection pool that reports wait time and saturation."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.stats = PoolStats()
+        super().__init__(*args, **kwargs)
+
+    async def get_connection(self, command_name: str, *keys: Any, **options: Any):
+        started = time.perf_counter()
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        finally:
+            self.stats.record_acquisition(time.perf_counter() - started)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Reports the pool usage.
+
+        :return: Pool usage report.
+        """
+        in_use = self.max_connections - self.pool.qsize()
+        return self.stats.report(in_use, self.max_connections)
+
+
+class InstrumentedSyncConnectionPool(redis.BlockingConnectionPool):
+    """A sync blocking connection pool that reports wait time and saturation."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.stats = PoolStats()
+        super().__init__(*args, **kwargs)
+
+    def get_connection(self, command_name: str, *keys: Any, **options: Any):
+        started = time.perf_counter()
+        try:
+            return super().get_connection(command_name, *keys, **options)
+        finally:
+            self.stats.record_acquisition(time.perf_counter() - started)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Reports the pool usage.
+
+        :return: Pool usage report.
+        """
+        in_use = self.max_connections - self.pool.qsize()
+        return self.stats.report(in_use, self.max_connections)
+
+
+def get_connection_kwargs(parser_class: Optional[type] = None) -> Dict[str, Any]:
+    """
+    Gets the connection pool arguments from settings.
+
+    :param parser_class: The reply parser, defaults to the client's default (hiredis if installed).
+    :return: Keyword arguments for the connection pool.
+    """
+    connection_kwargs = {
+        "max_connections": settings.redis_max_connections,
+        "timeout": settings.redis_pool_timeout,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "socket_keepalive": settings.redis_socket_keepalive,
+        "retry_on_timeout": settings.redis_retry_on_timeout,
+        "health_check_interval": settings.redis_health_check_interval,
+    }
+    if parser_class is not None:
+        connection_kwargs["parser_class"] = parser_class
+    return connection_kwargs
+
+
+def create_redis_pool(**kwargs: Any) -> InstrumentedConnectionPool:
+    """
+    Creates the shared async connection pool of the API.
+
+    :param kwargs: Overrides of the pool arguments.
+    :return: Connection pool.
+    """
+    parser_class = None
+    if not settings.redis_use_hiredis:
+        parser_class = aioredis.connection.PythonParser
+    return InstrumentedConnectionPool.from_url(
+        str(settings.redis_url),
+        **{**get_connection_kwargs(parser_class), **kwargs},
+    )
+
+
+def create_sync_redis(**kwargs: Any) -> redis.Redis:
+    """
+    Creates a sync redis client over a shared connection pool, used by the updater.
+
+    :param kwargs: Overrides of the pool arguments.
+    :return: Redis client.
+    """
+    parser_class = None
+    if not settings.redis_use_hiredis:
+        parser_class = redis.connection.PythonParser
+    pool = InstrumentedSyncConnectionPool.from_url(
+        str(settings.redis_url),
+        **{**get_connection_kwargs(parser_class), **kwargs},
+    )
+    return redis.Redis(connection_pool=pool)
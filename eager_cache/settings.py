@@ -23,6 +23,25 @@ class Settings(BaseSettings):
     redis_user: Optional[str] = None
     redis_pass: Optional[str] = None
     redis_base: Optional[int] = None
+    # size of the redis connection pool
+    redis_max_connections: int = 50
+    # seconds to wait for a free connection when the pool is exhausted
+    redis_pool_timeout: Optional[float] = 5
+    redis_socket_timeout: Optional[float] = 5
+    redis_socket_connect_timeout: Optional[float] = 5
+    redis_socket_keepalive: bool = True
+    redis_retry_on_timeout: bool = True
+    # seconds between pings of idle connections, 0 disables health checks
+    redis_health_check_interval: int = 30
+    # parse replies with hiredis when it is installed
+    redis_use_hiredis: bool = True
+    # quantity of workers for fetchers with a thread or process executor (None for the pool's default)
+    fetch_thread_workers_count: Optional[int] = None
+    fetch_process_workers_count: Optional[int] = None
+    # maximum number of pending refreshes in the updater, lowest priority ones are shed beyond it
+    refresh_queue_size: int = 1000
+    # quantity of updater threads issuing refreshes
+    refresh_workers_count: int = 4
 
     @property
     def redis_url(self) -> URL:
@@ -0,0 +1,154 @@
+import os
+import threading
+from typing import Any, Generator
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from eager_cache.fetchers.abstract_fetcher import (
+    REFRESH_HEADER,
+    STORAGE_HASH,
+    AbstractFetcher,
+    FetcherConfigError,
+    FetchError,
+    get_cache_keys,
+)
+from eager_cache.services.executor import (
+    EXECUTOR_PROCESS,
+    EXECUTOR_THREAD,
+    get_executor,
+    shutdown_executors,
+)
+from eager_cache.web.api.data.views import fetchers
+
+
+class ThreadFetcher(AbstractFetcher):
+    data_type = "thread_test"
+    executor = EXECUTOR_THREAD
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"thread": threading.get_ident(), **kwargs}
+
+
+class ProcessFetcher(AbstractFetcher):
+    data_type = "process_test"
+    executor = EXECUTOR_PROCESS
+    storage = STORAGE_HASH
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"pid": os.getpid(), **kwargs}
+
+
+class CrashingFetcher(AbstractFetcher):
+    data_type = "crashing_test"
+    executor = EXECUTOR_PROCESS
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        if kwargs.get("crash"):
+            os._exit(1)
+        return kwargs
+
+
+@pytest.fixture(autouse=True)
+def executors() -> Generator[None, None, None]:
+    yield
+    shutdown_executors()
+
+
+def test_get_executor() -> None:
+    assert get_executor(EXECUTOR_THREAD) is get_executor(EXECUTOR_THREAD)
+    with pytest.raises(ValueError):
+        get_executor("fiber")
+
+
+def test_fetcher_config_is_validated() -> None:
+    with pytest.raises(FetcherConfigError):
+
+        class FiberFetcher(AbstractFetcher):
+            data_type = "fiber_test"
+            executor = "fiber"
+
+    with pytest.raises(FetcherConfigError):
+
+        class ColumnsFetcher(AbstractFetcher):
+            data_type = "columns_test"
+            storage = "columns"
+
+    with pytest.raises(FetcherConfigError):
+
+        class LocalProcessFetcher(AbstractFetcher):
+            data_type = "local_process_test"
+            executor = EXECUTOR_PROCESS
+
+
+@pytest.mark.asyncio
+async def test_thread_executor(fake_redis: FakeRedis) -> None:
+    fetched = await ThreadFetcher.fetch(fake_redis, a="b")
+    cached = await ThreadFetcher.fetch(fake_redis, a="b")
+
+    assert fetched.data["thread"] != threading.get_ident()
+    assert fetched.data["a"] == "b"
+    assert cached == fetched
+
+
+@pytest.mark.asyncio
+async def test_process_executor(fake_redis: FakeRedis) -> None:
+    cache_key, shadow_cache_key = get_cache_keys(ProcessFetcher.data_type, a="b")
+    fetched = await ProcessFetcher.fetch(fake_redis, a="b")
+
+    assert fetched.data["pid"] != os.getpid()
+    assert await fake_redis.hget(cache_key, "a") == '"b"'
+
+    await fake_redis.delete(shadow_cache_key)
+    refetched = await ProcessFetcher.fetch(fake_redis, a="b")
+    projected = await ProcessFetcher.fetch(fake_redis, fields=["a"], a="b")
+
+    assert projected.data == {"a": "b"}
+    assert projected.last_retrieved == refetched.last_retrieved
+
+
+@pytest.mark.asyncio
+async def test_process_executor_recovers_from_dead_worker(
+    fake_redis: FakeRedis,
+) -> None:
+    await CrashingFetcher.fetch(fake_redis, a="b")
+    pool = get_executor(EXECUTOR_PROCESS)
+
+    with pytest.raises(FetchError):
+        await CrashingFetcher.fetch(fake_redis, crash="yes")
+
+    assert (await CrashingFetcher.fetch(fake_redis, a="c")).data == {"a": "c"}
+    assert get_executor(EXECUTOR_PROCESS) is not pool
+
+
+@pytest.mark.asyncio
+async def test_process_executor_refresh(fake_redis: FakeRedis) -> None:
+    cache_key, shadow_cache_key = get_cache_keys(ProcessFetcher.data_type, a="b")
+
+    assert await ProcessFetcher.refresh(fake_redis, a="b") is None
+    assert await fake_redis.hget(cache_key, "a") == '"b"'
+    assert await fake_redis.exists(shadow_cache_key)
+
+    cached = await ProcessFetcher.fetch(fake_redis, a="b")
+    assert cached.data["a"] == "b"
+
+
+def test_api_data_refresh(
+    client: TestClient,
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(fetchers, ThreadFetcher.data_type, ThreadFetcher)
+    url = fastapi_app.url_path_for("api_data", data_type=ThreadFetcher.data_type)
+
+    response = client.get(url, params={"a": "b"}, headers={REFRESH_HEADER: "1"})
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert response.content == b""
+
+    assert client.get(url, params={"a": "b"}).json()["data"]["a"] == "b"
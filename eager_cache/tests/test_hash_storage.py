@@ -0,0 +1,112 @@
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from eager_cache.fetchers.abstract_fetcher import (
+    STORAGE_HASH,
+    AbstractFetcher,
+    FetcherConfigError,
+    get_cache_keys,
+    get_negative_cache_key,
+    project,
+)
+from eager_cache.web.api.data.views import fetchers
+
+
+class HashFetcher(AbstractFetcher):
+    data_type = "hash_test"
+    storage = STORAGE_HASH
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"a": 1, "b": {"c": [2, 3]}, **kwargs}
+
+
+class BlobFetcher(AbstractFetcher):
+    data_type = "blob_test"
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"a": 1, "b": {"c": [2, 3]}}
+
+
+class ListHashFetcher(AbstractFetcher):
+    data_type = "list_hash_test"
+    storage = STORAGE_HASH
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return [1, 2]
+
+
+class MetaFieldHashFetcher(AbstractFetcher):
+    data_type = "meta_field_hash_test"
+    storage = STORAGE_HASH
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"a": 1, "__meta__": 2}
+
+
+def test_project() -> None:
+    assert project({"a": 1, "b": 2}, ["a", "c"]) == {"a": 1}
+    assert project([1, 2], ["a"]) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_hash_storage(fake_redis: FakeRedis) -> None:
+    cache_key, _ = get_cache_keys(HashFetcher.data_type, d="e")
+    fetched = await HashFetcher.fetch(fake_redis, d="e")
+
+    assert await fake_redis.type(cache_key) == "hash"
+    assert sorted(await fake_redis.hkeys(cache_key)) == ["__meta__", "a", "b", "d"]
+
+    cached = await HashFetcher.fetch(fake_redis, d="e")
+    assert cached == fetched
+
+    projected = await HashFetcher.fetch(fake_redis, fields=["b", "f"], d="e")
+    assert projected.data == {"b": {"c": [2, 3]}}
+    assert projected.last_modified == fetched.last_modified
+
+
+@pytest.mark.asyncio
+async def test_hash_storage_requires_mapping(fake_redis: FakeRedis) -> None:
+    cache_key, _ = get_cache_keys(ListHashFetcher.data_type)
+    with pytest.raises(FetcherConfigError):
+        await ListHashFetcher.fetch(fake_redis)
+
+    assert not await fake_redis.exists(get_negative_cache_key(cache_key))
+
+
+@pytest.mark.asyncio
+async def test_hash_storage_reserves_meta_field(fake_redis: FakeRedis) -> None:
+    cache_key, _ = get_cache_keys(MetaFieldHashFetcher.data_type)
+    with pytest.raises(FetcherConfigError):
+        await MetaFieldHashFetcher.fetch(fake_redis)
+
+    assert not await fake_redis.exists(cache_key)
+
+
+@pytest.mark.asyncio
+async def test_blob_storage_projection(fake_redis: FakeRedis) -> None:
+    fetched = await BlobFetcher.fetch(fake_redis, fields=["a"])
+    cached = await BlobFetcher.fetch(fake_redis, fields=["a"])
+
+    assert fetched.data == cached.data == {"a": 1}
+
+
+def test_api_data_fields(
+    client: TestClient,
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(fetchers, HashFetcher.data_type, HashFetcher)
+    url = fastapi_app.url_path_for("api_data", data_type=HashFetcher.data_type)
+    response = client.get(url, params={"d": "e", "fields": "a,d"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"a": 1, "d": "e"}
@@ -0,0 +1,160 @@
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from eager_cache.fetchers.abstract_fetcher import (
+    STORAGE_HASH,
+    AbstractFetcher,
+    DataDelta,
+    DataItem,
+    EmptyDataError,
+    apply_merge_patch,
+    get_cache_keys,
+)
+from eager_cache.web.api.data.views import fetchers
+
+
+class IncrementalFetcher(AbstractFetcher):
+    data_type = "incremental_test"
+    incremental = True
+    full_fetches = 0
+    changes: Any = {}
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        cls.full_fetches += 1
+        return {"a": 1, "b": {"c": 2, "d": 3}}
+
+    @classmethod
+    async def _fetch_delta(cls, previous: DataItem, **kwargs: Any) -> DataDelta:
+        return DataDelta(changes=cls.changes, cursor=(previous.cursor or 0) + 1)
+
+
+class HashIncrementalFetcher(AbstractFetcher):
+    data_type = "hash_incremental_test"
+    incremental = True
+    storage = STORAGE_HASH
+    changes: Any = {}
+    previous: Any = None
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+
+    @classmethod
+    async def _fetch_delta(cls, previous: DataItem, **kwargs: Any) -> DataDelta:
+        cls.previous = previous
+        return DataDelta(changes=cls.changes, cursor=(previous.cursor or 0) + 1)
+
+
+def test_apply_merge_patch() -> None:
+    target = {"a": 1, "b": {"c": 2, "d": 3}}
+    patch = {"a": None, "b": {"c": 4}, "e": [5]}
+
+    assert apply_merge_patch(target, patch) == {"b": {"c": 4, "d": 3}, "e": [5]}
+    assert target == {"a": 1, "b": {"c": 2, "d": 3}}
+
+
+def test_apply_merge_patch__replaces_non_mappings() -> None:
+    assert apply_merge_patch({"a": 1}, [1, 2]) == [1, 2]
+    assert apply_merge_patch([1, 2], {"a": 1}) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental(fake_redis: FakeRedis) -> None:
+    _, shadow_cache_key = get_cache_keys(IncrementalFetcher.data_type)
+    IncrementalFetcher.full_fetches = 0
+
+    first = await IncrementalFetcher.fetch(fake_redis)
+
+    IncrementalFetcher.changes = {}
+    await fake_redis.delete(shadow_cache_key)
+    unchanged = await IncrementalFetcher.fetch(fake_redis)
+
+    assert unchanged.data == first.data
+    assert unchanged.last_modified == first.last_modified
+    assert unchanged.cursor == 1
+
+    IncrementalFetcher.changes = {"b": {"c": 4}}
+    await fake_redis.delete(shadow_cache_key)
+    changed = await IncrementalFetcher.fetch(fake_redis)
+
+    assert changed.data == {"a": 1, "b": {"c": 4, "d": 3}}
+    assert changed.last_modified > first.last_modified
+    assert changed.cursor == 2
+    assert IncrementalFetcher.full_fetches == 1
+    assert (await IncrementalFetcher.fetch(fake_redis)).data == changed.data
+
+    IncrementalFetcher.changes = []
+    await fake_redis.delete(shadow_cache_key)
+    replaced = await IncrementalFetcher.fetch(fake_redis)
+
+    assert replaced.data == []
+    assert replaced.last_modified > changed.last_modified
+
+
+def test_api_data_hides_internal_fields(
+    client: TestClient,
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(fetchers, IncrementalFetcher.data_type, IncrementalFetcher)
+    url = fastapi_app.url_path_for("api_data", data_type=IncrementalFetcher.data_type)
+    response = client.get(url, params={"a": "b"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {"data", "last_retrieved", "last_modified"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_hash(
+    fake_redis: FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_key, shadow_cache_key = get_cache_keys(HashIncrementalFetcher.data_type)
+    first = await HashIncrementalFetcher.fetch(fake_redis)
+
+    async def hgetall(*args: Any) -> Any:
+        raise AssertionError("The whole hash should not be read")
+
+    monkeypatch.setattr(fake_redis, "hgetall", hgetall)
+    HashIncrementalFetcher.changes = {"a": None, "b": {"c": 5}, "f": [6]}
+    await fake_redis.delete(shadow_cache_key)
+    await HashIncrementalFetcher.refresh(fake_redis)
+
+    assert HashIncrementalFetcher.previous.data == {}
+    assert HashIncrementalFetcher.previous.cursor is None
+    assert sorted(await fake_redis.hkeys(cache_key)) == ["__meta__", "b", "e", "f"]
+    changed = await HashIncrementalFetcher.fetch(fake_redis, fields=["b", "e", "f"])
+    assert changed.data == {"b": {"c": 5, "d": 3}, "e": 4, "f": [6]}
+    assert changed.last_modified > first.last_modified
+    assert changed.cursor == 1
+
+    HashIncrementalFetcher.changes = {}
+    await fake_redis.delete(shadow_cache_key)
+    unchanged = await HashIncrementalFetcher.fetch(fake_redis, fields=["b", "e", "f"])
+
+    assert unchanged.data == changed.data
+    assert unchanged.last_modified == changed.last_modified
+    assert unchanged.last_retrieved > changed.last_retrieved
+    assert unchanged.cursor == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_incremental_hash_empty(
+    fake_redis: FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(HashIncrementalFetcher, "empty_ttl", 10)
+    cache_key, shadow_cache_key = get_cache_keys(HashIncrementalFetcher.data_type)
+    await HashIncrementalFetcher.fetch(fake_redis)
+
+    HashIncrementalFetcher.changes = {"a": None, "b": None, "e": None}
+    await fake_redis.delete(shadow_cache_key)
+    with pytest.raises(EmptyDataError):
+        await HashIncrementalFetcher.fetch(fake_redis)
+    assert not await fake_redis.exists(cache_key)
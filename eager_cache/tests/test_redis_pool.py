@@ -0,0 +1,74 @@
+import pytest
+from aioredis import Redis
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeConnection
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette import status
+
+from eager_cache.services.redis.pool import (
+    InstrumentedConnectionPool,
+    create_redis_pool,
+    create_sync_redis,
+)
+from eager_cache.settings import settings
+
+
+def test_create_redis_pool_uses_settings() -> None:
+    pool = create_redis_pool()
+
+    assert pool.max_connections == settings.redis_max_connections
+    assert pool.timeout == settings.redis_pool_timeout
+    assert pool.connection_kwargs["socket_timeout"] == settings.redis_socket_timeout
+    assert (
+        pool.connection_kwargs["health_check_interval"]
+        == settings.redis_health_check_interval
+    )
+
+
+def test_create_sync_redis_uses_settings() -> None:
+    pool = create_sync_redis(max_connections=3).connection_pool
+
+    assert pool.max_connections == 3
+    assert pool.connection_kwargs["retry_on_timeout"] == settings.redis_retry_on_timeout
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_saturation() -> None:
+    pool = InstrumentedConnectionPool(
+        max_connections=2,
+        connection_class=FakeConnection,
+        server=FakeServer(),
+    )
+    connection = await pool.get_connection("GET")
+
+    report = pool.report()
+    assert report["in_use"] == 1
+    assert report["saturation"] == 0.5
+    assert report["acquisitions"] == 1
+
+    await pool.release(connection)
+    assert pool.report()["in_use"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_is_shared_by_client() -> None:
+    pool = InstrumentedConnectionPool(
+        max_connections=1,
+        connection_class=FakeConnection,
+        server=FakeServer(),
+    )
+    redis = Redis(connection_pool=pool)
+    await redis.set("a", "b")
+
+    assert await redis.get("a") == b"b"
+    assert pool.report()["acquisitions"] == 2
+
+
+def test_redis_pool_stats(client: TestClient, fastapi_app: FastAPI) -> None:
+    url = fastapi_app.url_path_for("redis_pool_stats")
+    with client:
+        response = client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["max_connections"] == settings.redis_max_connections
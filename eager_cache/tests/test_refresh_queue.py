@@ -0,0 +1,99 @@
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from freezegun import freeze_time
+
+from eager_cache.fetchers.abstract_fetcher import AbstractFetcher, get_stats_key
+from eager_cache.refresh_queue import RefreshQueue, RefreshTask
+
+
+class StatsFetcher(AbstractFetcher):
+    data_type = "stats_test"
+
+    @classmethod
+    async def _fetch(cls, **kwargs: Any) -> Any:
+        return kwargs
+
+
+def test_refresh_task_priority() -> None:
+    cold = RefreshTask.from_stats(
+        "shadow:a", {"reads": "1", "fetch_cost": "0.5"}, now=100
+    )
+    hot = RefreshTask.from_stats(
+        "shadow:a", {"reads": "10", "fetch_cost": "0.5"}, now=100
+    )
+    expensive = RefreshTask.from_stats(
+        "shadow:a", {"reads": "1", "fetch_cost": "5"}, now=100
+    )
+    stale = RefreshTask.from_stats(
+        "shadow:a",
+        {"reads": "1", "fetch_cost": "0.5", "retrieved_at": "0"},
+        now=100,
+    )
+
+    assert hot.priority(100) > cold.priority(100)
+    assert expensive.priority(100) > cold.priority(100)
+    assert stale.priority(100) > cold.priority(100)
+    assert cold.priority(200) > cold.priority(100)
+
+
+def test_refresh_queue_pops_highest_priority() -> None:
+    queue = RefreshQueue(max_size=10)
+    queue.put("shadow:a", {"fetch_cost": "1"})
+    queue.put("shadow:b", {"fetch_cost": "3"})
+    queue.put("shadow:c", {"fetch_cost": "2"})
+
+    assert [queue.get().shadow_cache_key for _ in range(3)] == [
+        "shadow:b",
+        "shadow:c",
+        "shadow:a",
+    ]
+    assert queue.get(timeout=0) is None
+
+
+def test_refresh_queue_ages_waiting_tasks() -> None:
+    queue = RefreshQueue(max_size=10)
+    with freeze_time("2020-01-14 00:00:00") as frozen_time:
+        queue.put("shadow:cold", {"fetch_cost": "1"})
+        frozen_time.tick(120)
+        queue.put("shadow:hot", {"fetch_cost": "1.5"})
+
+        assert queue.get().shadow_cache_key == "shadow:cold"
+
+
+def test_refresh_queue_deduplicates_keys() -> None:
+    queue = RefreshQueue(max_size=10)
+    queue.put("shadow:a", {"fetch_cost": "1"})
+    queue.put("shadow:b", {"fetch_cost": "2"})
+    queue.put("shadow:a", {"fetch_cost": "3"})
+    queue.put("shadow:a", {"fetch_cost": "0"})
+
+    assert len(queue) == 2
+    task = queue.get()
+    assert (task.shadow_cache_key, task.weight) == ("shadow:a", 3)
+
+
+def test_refresh_queue_sheds_lowest_priority() -> None:
+    queue = RefreshQueue(max_size=2)
+    queue.put("shadow:a", {"fetch_cost": "2"})
+    queue.put("shadow:b", {"fetch_cost": "1"})
+    shed = queue.put("shadow:c", {"fetch_cost": "3"})
+
+    assert shed is not None
+    assert shed.shadow_cache_key == "shadow:b"
+    assert len(queue) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_records_stats(fake_redis: FakeRedis) -> None:
+    await StatsFetcher.fetch(fake_redis, a="b")
+    await StatsFetcher.fetch(fake_redis, a="b")
+    await StatsFetcher.fetch(fake_redis, a="b")
+
+    stats_key = get_stats_key("stats_test:a:b")
+    stats = await fake_redis.hgetall(stats_key)
+    assert stats["reads"] == "2"
+    assert 0 < await fake_redis.ttl(stats_key) <= StatsFetcher.stats_ttl()
+    assert float(stats["fetch_cost"]) >= 0
+    assert float(stats["retrieved_at"]) > 0
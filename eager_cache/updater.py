@@ -1,20 +1,27 @@
 from threading import Thread
+from time import sleep
 from typing import TypedDict
 
 import requests
-from redis import Redis
 from redis.client import PubSub
 
-from eager_cache.fetchers.abstract_fetcher import decode_shadow_cache_key
+from eager_cache.fetchers.abstract_fetcher import (
+    REFRESH_HEADER,
+    SEPARATOR,
+    SHADOW_KEY_PREFIX,
+    decode_shadow_cache_key,
+    get_stats_key,
+)
+from eager_cache.refresh_queue import RefreshQueue
+from eager_cache.services.redis.pool import create_sync_redis
 from eager_cache.settings import settings
 from log_utils import update_cache_logger
 
-redis = Redis(
-    host=settings.redis_host,
-    port=settings.redis_port,
-    username=settings.redis_user,
-    password=settings.redis_pass,
-)
+# Seconds between reports of the redis connection pool usage
+POOL_REPORT_INTERVAL = 60
+
+redis = create_sync_redis()
+refresh_queue = RefreshQueue(max_size=settings.refresh_queue_size)
 
 
 class KeyeventMessage(TypedDict):
@@ -26,12 +33,40 @@ class KeyeventMessage(TypedDict):
 
 def event_handler(event: KeyeventMessage) -> None:
     """
-    Receives the expire keyevent from redis, and issues a request to refetch the corresponding data from the server.
+    Receives the expire keyevent from redis, and queues a refetch of the corresponding data by its priority.
 
     :param event: The keyspace event.
     """
     update_cache_logger.info(f"Received event {event}", extra={"event": event})
     key = event["data"].decode()
+    if not key.startswith(SHADOW_KEY_PREFIX + SEPARATOR):
+        # Only expired shadow keys need a refetch (e.g. expired negative results are refetched on read)
+        return
+    cache_key = key.removeprefix(SHADOW_KEY_PREFIX + SEPARATOR)
+    stats = {
+        field.decode(): value
+        for field, value in redis.hgetall(get_stats_key(cache_key)).items()
+    }
+    shed = refresh_queue.put(key, stats)
+    update_cache_logger.info(
+        f"Queued refresh of {key}, queue size: {len(refresh_queue)}",
+        extra={"shadow_cache_key": key, "stats": stats},
+    )
+    if shed is not None:
+        # The shed key will be refetched on its next read
+        priority = shed.priority()
+        update_cache_logger.warning(
+            f"Refresh queue is full, shed {shed.shadow_cache_key} with priority {priority}",
+            extra={"shadow_cache_key": shed.shadow_cache_key, "priority": priority},
+        )
+
+
+def refresh(key: str) -> None:
+    """
+    Issues a request to refetch the data of the shadow key from the server.
+
+    :param key: The shadow cache key.
+    """
     data_fetch_url = decode_shadow_cache_key(key)
     full_url = (
         f"{settings.protocol}://{settings.host}:{settings.port}/api/data"
@@ -41,13 +76,38 @@ def event_handler(event: KeyeventMessage) -> None:
         f"Got data url {data_fetch_url}",
         extra={"data_fetch_url": data_fetch_url},
     )
-    r = requests.get(full_url)
+    # The data isn't needed, so the server only refreshes it and returns no content
+    r = requests.get(full_url, headers={REFRESH_HEADER: "1"})
     update_cache_logger.info(
-        f"Sent request to {data_fetch_url}, code: {r.status_code}, response: {r.json()}",
-        extra={"data_fetch_url": data_fetch_url, "code": r, "response": r.json()},
+        f"Sent request to {data_fetch_url}, code: {r.status_code}",
+        extra={"data_fetch_url": data_fetch_url, "code": r.status_code},
     )
 
 
+def refresh_worker() -> None:
+    """Refreshes the queued keys, highest priority first."""
+    while True:
+        task = refresh_queue.get()
+        try:
+            refresh(task.shadow_cache_key)
+        except Exception as ex:
+            update_cache_logger.exception(
+                f"Failed refreshing {task.shadow_cache_key}",
+                exc_info=ex,
+            )
+
+
+def pool_reporter() -> None:
+    """Logs the redis connection pool usage periodically."""
+    while True:
+        sleep(POOL_REPORT_INTERVAL)
+        report = redis.connection_pool.report()
+        update_cache_logger.info(
+            f"Redis connection pool usage: {report}",
+            extra={"redis_pool": report},
+        )
+
+
 def exception_handler(ex: Exception, pubsub: PubSub, thread: Thread) -> None:
     update_cache_logger.exception(exc_info=ex)
     thread.stop()
@@ -56,6 +116,9 @@ def exception_handler(ex: Exception, pubsub: PubSub, thread: Thread) -> None:
 
 
 def main():
+    for _ in range(settings.refresh_workers_count):
+        Thread(target=refresh_worker, daemon=True).start()
+    Thread(target=pool_reporter, daemon=True).start()
     pubsub = redis.pubsub()
     pubsub.psubscribe(**{"__keyevent@0__:expired": event_handler})
     pubsub.run_in_thread(sleep_time=0.01)
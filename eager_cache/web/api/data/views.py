@@ -1,9 +1,20 @@
+from typing import Optional
+
 from aioredis import Redis
-from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from eager_cache.fetchers import *
+from eager_cache.fetchers.abstract_fetcher import REFRESH_HEADER
 from eager_cache.services.redis.dependency import get_redis_connection
 
 router = APIRouter()
@@ -14,6 +25,10 @@ fetchers = {klass.data_type: klass for klass in AbstractFetcher.__subclasses__()
 async def api_data(
     data_type: str,
     request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated top-level fields of the data to return",
+    ),
     redis: Redis = Depends(get_redis_connection),
 ) -> Response:
     """
@@ -21,15 +36,41 @@ async def api_data(
 
     :param data_type: Data type to fetch.
     :param request: The request object, used for getting query params.
+    :param fields: Comma separated top-level fields of the data to return, all of them if omitted.
     :param redis: The redis object used to manage cache.
 
-    :raises HTTPException: If the data_type was not found, 404 is returned.
-    :return: Response
+    :raises HTTPException: If the data_type or its data were not found, 404 is returned.
+        If the data couldn't be fetched, 502 is returned.
+    :return: Response, with a `Warning` header if the data is stale.
+        Refreshes by the updater return 204 without the data.
     """
     if data_type not in fetchers:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Fetcher for data type {data_type} not found",
         )
-    result = await fetchers[data_type].fetch(redis, **request.query_params)
-    return JSONResponse(jsonable_encoder(result))
+    query_params = {
+        key: value for key, value in request.query_params.items() if key != "fields"
+    }
+    try:
+        if REFRESH_HEADER in request.headers:
+            await fetchers[data_type].refresh(redis, **query_params)
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+        result = await fetchers[data_type].fetch(
+            redis,
+            fields=fields.split(",") if fields is not None else None,
+            **query_params,
+        )
+    except EmptyDataError as ex:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(ex))
+    except FetchError:
+        # The error is logged by the fetcher, don't expose its details
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Upstream fetch failed",
+        )
+    # The cursor is an internal upstream position, and staleness is reported by the Warning header
+    response = JSONResponse(jsonable_encoder(result, exclude={"cursor", "stale"}))
+    if result.stale:
+        response.headers["Warning"] = '110 - "Response is Stale"'
+    return response
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
 
 router = APIRouter()
 
@@ -10,3 +12,14 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/health/redis-pool")
+def redis_pool_stats(request: Request) -> Dict[str, Any]:
+    """
+    Reports the redis connection pool usage.
+
+    :param request: The request object, used for getting the pool.
+    :return: Pool saturation and connection wait times.
+    """
+    return request.app.state.redis_pool.report()
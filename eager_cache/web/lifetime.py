@@ -1,20 +1,20 @@
 from typing import Awaitable, Callable
 
-import aioredis
+from aioredis import Redis
 from fastapi import FastAPI
 
-from eager_cache.settings import settings
+from eager_cache.services.executor import shutdown_executors
+from eager_cache.services.redis.pool import create_redis_pool
 
 
 def _setup_redis(app: FastAPI) -> None:
     """
-    Initialize redis connection.
+    Initialize redis connection pool, and the client shared by all requests.
 
     :param app: current FastAPI app.
     """
-    app.state.redis_pool = aioredis.ConnectionPool.from_url(
-        str(settings.redis_url),
-    )
+    app.state.redis_pool = create_redis_pool()
+    app.state.redis = Redis(connection_pool=app.state.redis_pool)
 
 
 def startup(app: FastAPI) -> Callable[[], Awaitable[None]]:
@@ -44,5 +44,6 @@ def shutdown(app: FastAPI) -> Callable[[], Awaitable[None]]:
 
     async def _shutdown() -> None:  # noqa: WPS430
         await app.state.redis_pool.disconnect()
+        shutdown_executors()
 
     return _shutdown